@@ -2169,6 +2169,51 @@ class DataReader(LabelSelection):
         slope0, slope1 = self.get_surrounding_slopes(indices, arr)
         return slope0 is not None and np.sign(slope0) == np.sign(slope1)
 
+    def get_obstacle_mask(self, arr):
+        """Check for each pixel row whether it is an obstacle
+
+        This method is a vectorized version of calling
+        ``self.is_obstacle([i], arr)`` for every row ``i`` in `arr`
+
+        Parameters
+        ----------
+        arr: np.ndarray
+            The 1D data array
+
+        Returns
+        -------
+        np.ndarray of dtype bool
+            A boolean array with the same length as `arr` that is True where
+            the corresponding row is an obstacle"""
+        def run_lengths(a):
+            # the number of consecutive values that are equal to a[i] and
+            # end at i. NaNs never equal anything
+            n = len(a)
+            starts = np.r_[True, a[1:] != a[:-1]]
+            ret = np.arange(1, n + 1) - np.maximum.accumulate(
+                np.where(starts, np.arange(n), 0))
+            ret[np.isnan(a)] = 0
+            return ret
+
+        arr = np.asarray(arr, dtype=float)
+        n = len(arr)
+        ret = np.zeros(n, dtype=bool)
+        if n < 3:
+            return ret
+        i = np.arange(1, n - 1)
+        # length of the interval below the row (see get_surrounding_slopes)
+        nlower = run_lengths(arr)[i - 1]
+        # length of the interval starting at the row
+        nhigher = run_lengths(arr[::-1])[::-1][i]
+        valid = ((nlower > 0) & (nhigher > 0) & (i - nlower - 1 > 0) &
+                 (i + nhigher < n))
+        i, nlower, nhigher = i[valid], nlower[valid], nhigher[valid]
+        with np.errstate(invalid='ignore'):
+            slope0 = (arr[i - 1] - arr[i - nlower - 1]) / nlower
+            slope1 = (arr[i + nhigher] - arr[i]) / nhigher
+            ret[i] = np.sign(slope0) == np.sign(slope1)
+        return ret
+
     def _interp(self, x, y):
         """Estimate slope and interception"""
         slope = (y[-1] - y[0]) / (x[-1] - x[0])
@@ -2489,8 +2534,9 @@ class DataReader(LabelSelection):
                  col, get_child(col).find_potential_samples(
                     col, *args, **kwargs)[0]))
             for col in df.columns))
+        arr = _Bar.bars2array(bars)
         for bar in bars:
-            bar.get_overlaps(bars, min_fract)
+            bar.get_overlaps(bars, min_fract, arr=arr)
         ret = []
         for bar in bars:
             if bar.all_overlaps is None:
@@ -3526,30 +3572,46 @@ class BarDataReader(DataReader):
             last_start = np.where(~isnan_or_0(arr))[0][0]
         except IndexError:  # no data in here
             return [], [], []
+        # look up everything that does not change during the scan only once
+        empty = isnan_or_0(arr).tolist()
+        values = arr.tolist()
+        tolerance = self.tolerance
         last_end = last_start
-        last_val = last_start_val = arr[last_end]
+        last_val = last_start_val = values[last_end]
+        #: the maximum of ``arr[last_start:last_end + 1]`` (NaN if any of
+        #: the values is NaN, as with :meth:`numpy.ndarray.max`)
+        cur_max = last_start_val
         last_state = state = 1  #: state for increasing (1) or decreasing (-1)
         nrows = len(arr) - 1
-        for i, value in enumerate(arr[last_start+1:], last_start + 1):
-            if not isnan_or_0(value) and not isnan_or_0(last_val):
-                state = np.sign(value - last_val)
+        rounded = self._rounded
+        if rounded:
+            obstacles = self.get_obstacle_mask(arr).tolist()
+        for i in range(last_start + 1, nrows + 1):
+            value = values[i]
+            is_empty = empty[i]
+            last_empty = empty[i - 1]
+            if not is_empty and not last_empty:
+                state = (value > last_val) - (value < last_val)
             else:
                 state = 0
             if i == nrows:
                 last_end += 1
-            if isnan_or_0(last_val) and not isnan_or_0(value):
+                if cur_max == cur_max and not cur_max >= value:
+                    cur_max = value
+            if last_empty and not is_empty:
                 last_start = i
-                last_start_val = value
-            elif ((isnan_or_0(value) and not isnan_or_0(last_val)) or
-                  (self._rounded and state and state > last_state and
-                   not self.is_obstacle([i], arr)) or
-                  (np.abs(value - last_start_val) > self.tolerance) or
-                  (not isnan_or_0(value) and i == nrows)):
-                indices = [last_start, last_end + 1]
-                all_indices.append(indices)
-                heights.append(arr[slice(*indices)].max())
+                last_start_val = cur_max = value
+            elif ((is_empty and not last_empty) or
+                  (rounded and state and state > last_state and
+                   not obstacles[i]) or
+                  (abs(value - last_start_val) > tolerance) or
+                  (not is_empty and i == nrows)):
+                all_indices.append([last_start, last_end + 1])
+                heights.append(cur_max)
                 last_start = i
-                last_start_val = value
+                last_start_val = cur_max = value
+            elif cur_max == cur_max and not cur_max >= value:
+                cur_max = value
             last_end = i
             last_val = value
             if state:
@@ -3585,14 +3647,16 @@ class BarDataReader(DataReader):
             self._full_df_orig = df.copy(True)
         self._all_indices = []
         self._splitted = {}
-        for col in df.columns:
-            indices, values, splitted = self.get_bars(df[col].values,
-                                                      do_split)
+        # fill the bars into a plain array instead of setting every bar via
+        # df.loc
+        vals = np.full(df.shape, np.nan)
+        for icol, (col, arr) in enumerate(zip(df.columns, df.values.T)):
+            indices, values, splitted = self.get_bars(arr, do_split)
             self._all_indices.append(indices)
             self._splitted[col] = splitted
-            df.loc[:, col] = np.nan
             for (i, j), v in zip(indices, values):
-                df.loc[i:j, col] = v
+                vals[i:j+1, icol] = v
+        df = pd.DataFrame(vals, index=df.index, columns=df.columns)
         if inplace:
             self.full_df = df
         else:
@@ -3616,9 +3680,15 @@ class BarDataReader(DataReader):
                 pixels[[col for col in self.columns if col < npx]],
                 fillvalue=pixels[-1]):
             if pixel:  # shift the column upwards
-                for l in chain(self._all_indices[col], self._splitted[col]):
-                    for j in range(len(l)):
-                        l[j] = max(0, l[j] - pixel)
+                # the splitted bars might be the same objects as in
+                # self._all_indices, so we make sure to shift them only once
+                bars = list({id(l): l for l in chain(
+                    self._all_indices[col], self._splitted[col])}.values())
+                if not bars:
+                    continue
+                shifted = np.maximum(np.asarray(bars) - pixel, 0)
+                for l, indices in zip(bars, shifted.tolist()):
+                    l[:] = indices
 
     @docstrings.dedent
     def find_potential_samples(self, col, min_len=None,
@@ -3642,16 +3712,15 @@ class BarDataReader(DataReader):
         find_samples
         """
 
-        def do_append(indices):
-            if min_len is not None and np.diff(indices) <= min_len:
-                return False
-            elif max_len is not None and np.diff(indices) > max_len:
-                return False
-            elif filter_func is not None:
-                return filter_func(indices)
-            return True
-        col = list(self.columns).index(col)
-        return list(filter(do_append, self._all_indices[col])), []
+        all_indices = self._all_indices[list(self.columns).index(col)]
+        lengths = np.diff(np.reshape(all_indices, (-1, 2)), axis=1)[:, 0]
+        mask = np.ones(len(lengths), dtype=bool)
+        if min_len is not None:
+            mask &= lengths > min_len
+        if max_len is not None:
+            mask &= lengths <= max_len
+        return [indices for indices, m in zip(all_indices, mask)
+                if m and (filter_func is None or filter_func(indices))], []
 
     def create_grouper(self, ds, columns, *args, **kwargs):
         group = 'Columns %i - %i' % (min(columns), max(columns))
@@ -3664,43 +3733,51 @@ class BarDataReader(DataReader):
 class _Bar(object):
     """An object representing one bar in a pollen diagramm"""
 
-    @property
-    def loc(self):
-        """The location of the bar"""
-        try:
-            return self._loc
-        except AttributeError:
-            self._loc = np.mean(self.indices)
-        return self._loc
+    __slots__ = ('col', 'vmin', 'vmax', 'loc', 'iloc', 'overlaps',
+                 'all_overlaps', '_cols_map_cache', '_mean_loc')
 
     @property
-    def iloc(self):
-        """The :attr:`loc` as integer"""
-        return np.round(self.loc).astype(int)
+    def indices(self):
+        """The start and end of the bar"""
+        return [self.vmin, self.vmax]
 
     @property
     def mean_loc(self):
-        if self.all_overlaps is not None:
-            return np.mean(list(chain.from_iterable(
-                b.indices for b in self.all_overlaps)))
+        """The mean of the boundaries of this bar and its overlaps"""
+        if self._mean_loc is not None:
+            return self._mean_loc
+        elif self.all_overlaps is not None:
+            return self._get_mean_loc(self.all_overlaps)
         elif self.overlaps is not None:
-            return np.mean(list(chain.from_iterable(
-                b.indices for b in self.overlaps + [self])))
+            return self._get_mean_loc(self.overlaps + [self])
         return self.loc
 
+    @staticmethod
+    def _get_mean_loc(bars):
+        return sum(b.vmin + b.vmax for b in bars) / (2 * len(bars))
+
     @property
     def imean_loc(self):
         return np.round(self.mean_loc).astype(int)
 
     @property
     def cols_map(self):
-        ret = defaultdict(list)
+        """Mapping from column to the bars in :attr:`all_overlaps`
+
+        The mapping is computed only once for all bars in
+        :attr:`all_overlaps` (see :meth:`get_all_overlaps`)"""
+        if self._cols_map_cache is not None:
+            return self._cols_map_cache
         if self.all_overlaps:
             bars = self.all_overlaps
         elif self.overlaps:
             bars = self.overlaps + [self]
         else:
             bars = [self]
+        return self._get_cols_map(bars)
+
+    def _get_cols_map(self, bars):
+        ret = defaultdict(list)
         for bar in bars:
             ret[bar.col].append(bar)
         for col, bars in ret.items():
@@ -3717,65 +3794,120 @@ class _Bar(object):
                for col, bars in cols_map.items()}
         return {col: [l[0], l[1]] for col, l in ret.items()}
 
-    #: Other bars that overlap for at least 70%
-    overlaps = None
-
-    #: bars from :attr:`overlaps` plus their :attr:`overlaps`
-    all_overlaps = None
-
     def __init__(self, col, indices):
         self.col = col
-        self.indices = indices
+        #: The first pixel row of the bar
+        self.vmin = int(indices[0])
+        #: The last pixel row of the bar
+        self.vmax = int(indices[-1])
+        #: The location of the bar
+        self.loc = 0.5 * (self.vmin + self.vmax)
+        #: The :attr:`loc` as integer
+        self.iloc = int(round(self.loc))
+        #: Other bars that overlap for at least 70%
+        self.overlaps = None
+        #: bars from :attr:`overlaps` plus their :attr:`overlaps`
+        self.all_overlaps = None
+        self._cols_map_cache = None
+        self._mean_loc = None
 
     def bar_filter(self, bar):
         """Check if the given bar might overlap"""
         if bar.col == self.col:
             return False
-        elif bar.indices[0] > self.indices[-1]:
+        elif bar.vmin > self.vmax:
             return False
-        elif bar.indices[-1] < self.indices[0]:
+        elif bar.vmax < self.vmin:
             return False
         return True
 
-    def get_overlaps(self, bars, min_fract=0.9, closest=True):
-
-        def dist(bar):
-            return np.abs(self.loc - bar.loc)
-
-        d = defaultdict(list)
-        vmin1, vmax1 = self.indices
-        n1 = vmax1 - vmin1
-        for bar in filter(self.bar_filter, bars):
-            vmin2, vmax2 = bar.indices
-            min_len = min(n1, vmax2 - vmin2)
-            if (min(vmax1, vmax2) - max(vmin1, vmin2) >=
-                    min(min_len - 1, min_fract * min_len)):
-                d[bar.col].append(bar)
-        # if we found multiple bars per column, we take the one that is the
-        # closest
-        if closest:
-            for col, l in filter(lambda t: len(t[1]) > 1, d.items()):
-                d[col] = [min(l, key=dist)]
-        self.overlaps = list(chain.from_iterable(d.values()))
+    @staticmethod
+    def bars2array(bars):
+        """Convert a list of bars into an array
 
-    def get_all_overlaps(self):
+        Parameters
+        ----------
+        bars: list of :class:`_Bar`
+            The bars to convert
 
-        def insert_overlaps(bar):
-            for b in bar.overlaps:
-                if (b.all_overlaps is None and b not in all_overlaps and
-                        b.col not in cols):
-                    all_overlaps.append(b)
-                    cols.append(b.col)
-                    insert_overlaps(b)
+        Returns
+        -------
+        np.ndarray of shape ``(len(bars), 4)``
+            The :attr:`vmin`, :attr:`vmax`, :attr:`col` and :attr:`loc` of
+            each bar"""
+        return np.array([(b.vmin, b.vmax, b.col, b.loc) for b in bars],
+                        dtype=float).reshape((-1, 4))
 
+    def get_overlaps(self, bars, min_fract=0.9, closest=True, arr=None):
+        """Find the bars in other columns that overlap with this bar
+
+        Parameters
+        ----------
+        bars: list of :class:`_Bar`
+            The candidates
+        min_fract: float
+            The minimum fraction that two bars have to overlap
+        closest: bool
+            If True and we find multiple bars in one column, we only take the
+            one that is the closest to this bar
+        arr: np.ndarray
+            The result of :meth:`bars2array` for the given `bars`. If None,
+            it is computed from `bars`"""
+        if arr is None:
+            arr = self.bars2array(bars)
+        vmin2, vmax2, cols, locs = arr.T
+        vmin1, vmax1 = self.vmin, self.vmax
+        min_len = np.minimum(vmax1 - vmin1, vmax2 - vmin2)
+        found = np.where(
+            (cols != self.col) & (vmin2 <= vmax1) & (vmax2 >= vmin1) &
+            (np.minimum(vmax1, vmax2) - np.maximum(vmin1, vmin2) >=
+             np.minimum(min_len - 1, min_fract * min_len)))[0]
+        # the columns are sorted by their first appearance in `bars`
+        first, inv = np.unique(cols[found], return_index=True,
+                               return_inverse=True)[1:]
+        if closest and len(found):
+            # if we found multiple bars per column, we take the one that is
+            # the closest
+            order = np.lexsort((found, np.abs(self.loc - locs[found]),
+                                cols[found]))
+            sorted_cols = cols[found[order]]
+            is_first = np.r_[True, sorted_cols[1:] != sorted_cols[:-1]]
+            found = found[order[is_first]][np.argsort(first, kind='stable')]
+        else:
+            found = found[np.lexsort((found, first[inv]))]
+        self.overlaps = [bars[i] for i in found]
+
+    def get_all_overlaps(self):
+        """Collect the :attr:`overlaps` of this bar and of its overlaps
+
+        The bars are visited in a depth-first order (using an explicit stack
+        instead of recursion) and only one bar per column is accepted."""
         if self.all_overlaps is not None:
             return
 
         all_overlaps = [self]
-        cols = [self.col]
-        insert_overlaps(self)
+        seen = {id(self)}
+        cols = {self.col}
+        stack = [iter(self.overlaps)]
+        while stack:
+            b = next(stack[-1], None)
+            if b is None:
+                stack.pop()
+            elif (b.all_overlaps is None and id(b) not in seen and
+                    b.col not in cols):
+                all_overlaps.append(b)
+                seen.add(id(b))
+                cols.add(b.col)
+                stack.append(iter(b.overlaps))
+        # all bars share the same mean location and columns map
+        mean_loc = self._get_mean_loc(all_overlaps)
         for bar in all_overlaps:
             bar.all_overlaps = all_overlaps[:]
+            bar._mean_loc = mean_loc
+        # we accepted only one bar per column, so there is nothing to group
+        cols_map = {bar.col: [bar] for bar in all_overlaps}
+        for bar in all_overlaps:
+            bar._cols_map_cache = cols_map
 
 
 class RoundedBarDataReader(BarDataReader):
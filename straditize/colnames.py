@@ -1,6 +1,12 @@
 # -*- coding: utf-8 -*-
 """Module for text recognition
 
+Note that importing this module sets the ``OMP_THREAD_LIMIT`` environment
+variable to 1 (unless it is already set), if tesseract and tesserocr are
+available. This limits OpenMP runtimes that are initialized afterwards in this
+process and its subprocesses to one thread. Set the variable before importing
+straditize to override it.
+
 **Disclaimer**
 
 Copyright (C) 2018-2019  Philipp S. Sommer
@@ -18,17 +24,20 @@ GNU General Public License for more details.
 You should have received a copy of the GNU General Public License
 along with this program. If not, see <https://www.gnu.org/licenses/>.
 """
+import os
 import re
+import weakref
+import hashlib
 import xarray as xr
 from PIL import ImageOps, Image
 from straditize.common import rgba2rgb
 import numpy as np
 import subprocess as spr
-from collections import namedtuple
+from collections import namedtuple, OrderedDict
+from functools import lru_cache
+from operator import itemgetter
 from psyplot.data import safe_list
 
-from functools import partial
-
 
 # check tesseract version and import tesserocr. If the tesseract version
 # is 4.0.*, then we have to locale.setlocale(locale.LC_ALL, 'C')
@@ -44,21 +53,103 @@ else:
         import locale
         locale.setlocale(locale.LC_ALL, 'C')
     try:
+        # We only OCR small images (one text line at a time) for which the
+        # OpenMP parallelization of tesseract is mainly overhead. The OpenMP
+        # runtime reads OMP_THREAD_LIMIT only once when it is initialized,
+        # i.e. when tesserocr loads libtesseract. Therefore this has to happen
+        # right before the import (and it has no effect if the OpenMP runtime
+        # has already been loaded by another module). If you want to process
+        # images in parallel, use multiple processes instead
+        os.environ.setdefault('OMP_THREAD_LIMIT', '1')
         import tesserocr
     except ImportError:
         tesserocr = None
 
 
+def _image_key(image):
+    """Get a key for the :attr:`ColNamesReader._ocr_cache` from the content of
+    an image"""
+    return (image.mode, image.size,
+            hashlib.blake2b(image.tobytes(), digest_size=16).digest())
+
+
+@lru_cache(maxsize=8)
+def _rotation_matrices(height, rotate):
+    """Get the affine matrices for :meth:`ColNamesReader.transform_point`
+
+    Parameters
+    ----------
+    height: int
+        The height of the unrotated image
+    rotate: float
+        The rotation angle in degrees
+
+    Returns
+    -------
+    np.ndarray
+        The 3x3 matrix to transform into the rotated image
+    np.ndarray
+        The 3x3 matrix to transform from the rotated image"""
+    angle = np.deg2rad(rotate)
+    cos, sin = np.cos(angle), np.sin(angle)
+    # rotation around the origin followed by a shift of height*sin to the
+    # right, such that the rotated image starts at x=0
+    rot = np.array([[cos, -sin], [sin, cos]])
+    shift = np.array([height * sin, 0])
+    fwd = np.eye(3)
+    fwd[:2, :2] = rot
+    fwd[:2, 2] = shift
+    inv = np.eye(3)
+    inv[:2, :2] = rot.T
+    inv[:2, 2] = -rot.T.dot(shift)
+    return fwd, inv
+
+
+def _apply_affine(matrix, x, y):
+    """Transform the point `x`, `y` with the 3x3 affine `matrix`"""
+    (a, b, c), (d, e, f) = matrix[:2].tolist()
+    return a * x + b * y + c, d * x + e * y + f
+
+
+# Image.Transpose has been introduced with Pillow 9.1
+_Transpose = getattr(Image, 'Transpose', Image)
+
+#: The :meth:`PIL.Image.Image.transpose` methods that are equivalent to
+#: :meth:`ColNamesReader.rotate_image` for a rotation by a multiple of 90
+#: degrees. Keys are tuples ``(rotate % 360, mirror, flip)``, None means no
+#: transformation
+_transpose_methods = {
+    (0, False, False): None,
+    (0, False, True): 'FLIP_TOP_BOTTOM',
+    (0, True, False): 'FLIP_LEFT_RIGHT',
+    (0, True, True): 'ROTATE_180',
+    (90, False, False): 'ROTATE_270',
+    (90, False, True): 'TRANSPOSE',
+    (90, True, False): 'TRANSVERSE',
+    (90, True, True): 'ROTATE_90',
+    (180, False, False): 'ROTATE_180',
+    (180, False, True): 'FLIP_LEFT_RIGHT',
+    (180, True, False): 'FLIP_TOP_BOTTOM',
+    (180, True, True): None,
+    (270, False, False): 'ROTATE_90',
+    (270, False, True): 'TRANSVERSE',
+    (270, True, False): 'TRANSPOSE',
+    (270, True, True): 'ROTATE_270',
+    }
+
+
 _Bbox = namedtuple('_Bbox', tuple('xywh'))
 
 
 class Bbox(_Bbox):
     """A bounding box for a column name"""
 
-    @property
-    def top(self):
-        """The top of the box"""
-        return self.y
+    # no instance dictionary, the box is fully defined by x, y, w and h
+    __slots__ = ()
+
+    # aliases for the x and y fields. itemgetter makes them as cheap as
+    # the namedtuple fields themselves
+    top = property(itemgetter(1), doc="The top of the box")
 
     @property
     def bottom(self):
@@ -70,10 +161,7 @@ class Bbox(_Bbox):
         """The right edge of the box"""
         return self.x + self.w
 
-    @property
-    def left(self):
-        """The left edge of the box"""
-        return self.x
+    left = property(itemgetter(0), doc="The left edge of the box")
 
     @property
     def bounds(self):
@@ -83,27 +171,23 @@ class Bbox(_Bbox):
     @property
     def extents(self):
         """A list ``[x0, x1, y0, y1]`` with ``x0 <= x1`` and ``y0 <= y1``"""
-        return sorted([self.x0, self.x1]) + sorted([self.y0, self.y1])
+        x, y, w, h = self
+        x1, y0 = x + w, y + h
+        return [min(x, x1), max(x, x1), min(y, y0), max(y, y0)]
 
     @property
     def crop_extents(self):
         """The extents necessary for PIL.Image.crop"""
-        return self.left, self.top, self.right, self.bottom
+        x, y, w, h = self
+        return x, y, x + w, y + h
 
     @property
     def corners(self):
         """A np.ndarray of shape (4, 2) with the corners of the box"""
-        return np.array([
-            [self.left, self.bottom],
-            [self.left, self.top],
-            [self.right, self.bottom],
-            [self.right, self.top]
-            ])
+        x, y, w, h = self
+        return np.array([[x, y + h], [x, y], [x + w, y + h], [x + w, y]])
 
-    @property
-    def x0(self):
-        """The left edge"""
-        return self.left
+    x0 = property(itemgetter(0), doc="The left edge")
 
     @property
     def height(self):
@@ -118,17 +202,14 @@ class Bbox(_Bbox):
     @property
     def x1(self):
         """The right edge"""
-        return self.right
+        return self.x + self.w
 
     @property
     def y0(self):
         """The lower (bottom) edge"""
-        return self.bottom
+        return self.y + self.h
 
-    @property
-    def y1(self):
-        """The upper (top) edge"""
-        return self.top
+    y1 = property(itemgetter(1), doc="The upper (top) edge")
 
     @classmethod
     def from_dict(cls, d):
@@ -160,6 +241,37 @@ class ColNamesReader(object):
     #: :attr:`highres_image` if the :attr:`ignore_data_part` is True
     data_ylim = None
 
+    _tess_api = None
+
+    #: The :class:`weakref.finalize` that ends the :attr:`tess_api`
+    _tess_finalizer = None
+
+    #: The maximum number of texts in the :attr:`_ocr_cache`
+    ocr_cache_size = 512
+
+    #: A mapping from image keys (see :func:`_image_key`) to the texts that
+    #: have been recognized by the :attr:`tess_api` in the corresponding image
+    _ocr_cache = None
+
+    @property
+    def tess_api(self):
+        """The :class:`tesserocr.PyTessBaseAPI` to recognize text
+
+        The API is created on the first access and then reused for all calls
+        of :meth:`recognize_text` and :meth:`find_colnames`, such that the
+        language data is only loaded once"""
+        if tesserocr is None:
+            raise ImportError("tesserocr module not found!")
+        if self._tess_api is None:
+            if tesseract_version.startswith('4.0.'):
+                # LC_ALL might have been changed by some other module, so we
+                # set it here again to "C"
+                import locale
+                locale.setlocale(locale.LC_ALL, 'C')
+            self._tess_api = api = tesserocr.PyTessBaseAPI()
+            self._tess_finalizer = weakref.finalize(self, api.End)
+        return self._tess_api
+
     @property
     def highres_image(self):
         """The :attr:`image` attribute with higher resolution and with masked
@@ -169,11 +281,20 @@ class ColNamesReader(object):
         ret = (self.image if self._highres_image is None else
                self._highres_image)
         if self.data_ylim is not None and self.ignore_data_part:
-            arr = np.array(ret)
-            ylim = self.data_ylim * ret.size[1] / self.image.size[1]
-            arr[slice(*ylim.astype(int)), :, :-1] = 255
-            arr[slice(*ylim.astype(int)), :, -1] = 0
-            ret = Image.fromarray(arr)
+            ylim = tuple(
+                (self.data_ylim * ret.size[1] / self.image.size[1]).astype(
+                    int))
+            cached = self._masked_hr_cache
+            if cached is not None and cached[0] is ret and cached[1] == ylim:
+                return cached[2]
+            source = ret
+            ret = source.copy()
+            # fill the data part with transparent white. We use the same
+            # limits as numpy would for ``arr[y0:y1]``
+            y0, y1 = slice(*ylim).indices(ret.size[1])[:2]
+            if y1 > y0:
+                ret.paste((255, 255, 255, 0), (0, y0, ret.size[0], y1))
+            self._masked_hr_cache = (source, ylim, ret)
         return ret
 
     @highres_image.setter
@@ -183,9 +304,23 @@ class ColNamesReader(object):
         :attr:`data_ylim` attribute is not None. The data part is then set to
         white with 0 alpha"""
         self._highres_image = value
+        self._masked_hr_cache = None
+        self._rotated_cache.pop('hr', None)
 
     _highres_image = None
 
+    #: A tuple ``(source, ylim, masked)`` with the last image that has been
+    #: masked in the :attr:`highres_image`
+    _masked_hr_cache = None
+
+    #: A mapping from ``'image'`` and ``'hr'`` to a tuple
+    #: ``(source, rotate, mirror, flip, rotated)`` with the last rotated
+    #: :attr:`image` and :attr:`highres_image` (see :meth:`_rotate_cached`)
+    _rotated_cache = None
+
+    #: The last result of the :meth:`_get_text_lines` method
+    _text_lines_cache = None
+
     @property
     def column_names(self):
         """The names of the columns"""
@@ -218,7 +353,7 @@ class ColNamesReader(object):
     def rotated_image(self):
         """The rotated :attr:`image` based on the :meth:`rotate_image` method
         """
-        return self.rotate_image(self.image)
+        return self._rotate_cached('image', self.image)
 
     def __init__(self, image, bounds, rotate=45, mirror=False, flip=False,
                  highres_image=None, data_ylim=None):
@@ -255,6 +390,8 @@ class ColNamesReader(object):
         else:
             if mode != 'RGBA':
                 image = image.convert('RGBA')
+        self._rotated_cache = {}
+        self._ocr_cache = OrderedDict()
         self.image = image
         self.column_bounds = bounds
         self.rotate = rotate
@@ -285,6 +422,13 @@ class ColNamesReader(object):
 
     def close(self):
         """Close the column names reader"""
+        if self._tess_finalizer is not None:
+            # ends the API exactly once and releases the reference to it
+            self._tess_finalizer()
+            del self._tess_finalizer, self._tess_api
+        self._masked_hr_cache = self._text_lines_cache = None
+        self._rotated_cache.clear()
+        self._ocr_cache.clear()
         self._colpics.clear()
         self._column_names.clear()
         self.image.close()
@@ -356,7 +500,7 @@ class ColNamesReader(object):
             The part of the rotated :attr:`highres_image` cropped out from the
             given parameters"""
         hr = self.highres_image
-        image = self.rotate_image(hr)
+        image = self._get_rotated_hr(hr)
         xs_hr, ys_hr = hr.size
         xs, ys = self.image.size
         x01, y01 = self.transform_point(x0, y0, invert=True)
@@ -390,16 +534,20 @@ class ColNamesReader(object):
         self.create_variable(ds, 'rotate_colnames', self.rotate)
         self.create_variable(ds, 'mirror_colnames', self.mirror)
         self.create_variable(ds, 'flip_colnames', self.flip)
-        if any(self.colpics):
-            extents = np.array([colpic.size[::-1] if colpic else (0, 0)
-                                for colpic in self.colpics])
+        colpics = self.colpics
+        if any(pic is not None for pic in colpics):
+            arrays = [None if pic is None else np.asarray(pic)
+                      for pic in colpics]
+            extents = np.array([(0, 0) if arr is None else arr.shape[:2]
+                                for arr in arrays])
             self.create_variable(ds, 'colpic_extents', extents)
-            colpics_shp = (len(extents), ) + tuple(extents.max(axis=0)) + (4, )
             colpics = np.zeros(
-                colpics_shp,
-                dtype=next(np.asarray(pic).dtype for pic in self.colpics))
-            for i, (pic, (ys, xs)) in enumerate(zip(self.colpics, extents)):
-                colpics[i, :ys, :xs, :] = np.asarray(pic)
+                (len(extents), ) + tuple(extents.max(axis=0)) + (4, ),
+                dtype=next(arr.dtype for arr in arrays if arr is not None))
+            for i, arr in enumerate(arrays):
+                if arr is not None:
+                    ys, xs = arr.shape[:2]
+                    colpics[i, :ys, :xs] = arr
             self.create_variable(ds, 'colpic', colpics)
         return ds
 
@@ -456,14 +604,12 @@ class ColNamesReader(object):
         float
             The transformed `y`-coordinate
         """
-        import matplotlib.transforms as mt
-        angle = np.deg2rad(self.rotate)
         if image is None:
             image = self.image
         xs, ys = image.size
-        trans = mt.Affine2D().rotate(angle).translate(ys*np.sin(angle), 0)
+        fwd, inv = _rotation_matrices(ys, float(self.rotate))
         if invert:
-            x, y = trans.inverted().transform_point([x, y])
+            x, y = _apply_affine(inv, x, y)
         if self.mirror:
             x = xs - x
         if self.flip:
@@ -471,7 +617,7 @@ class ColNamesReader(object):
         if invert:
             return x, y
         else:
-            return trans.transform_point([x, y])
+            return _apply_affine(fwd, x, y)
 
     def navigate_to_col(self, col, ax):
         """Navigate to the specified column
@@ -519,8 +665,8 @@ class ColNamesReader(object):
         if self.mirror:
             xmin, xmax = xs - xmax, xs - xmin
         angle = np.deg2rad(self.rotate)
-        x = ys * np.sin(angle) + xmin * np.cos(angle)
-        y = xmin * np.sin(angle)
+        x, y = _apply_affine(
+            _rotation_matrices(ys, float(self.rotate))[0], xmin, 0)
         patch = patches.Rectangle((x, y), xmax-xmin, ys, color="red",
                                   alpha=0.50)
         tr = mpl.transforms.Affine2D().rotate_around(x, y, angle)
@@ -545,14 +691,67 @@ class ColNamesReader(object):
         PIL.Image.Image
             The target image
         """
+        mirror, flip = bool(self.mirror), bool(self.flip)
+        angle = float(self.rotate) % 360
+        if angle % 90 == 0:
+            # mirroring, flipping and rotating can be done in one transpose
+            method = _transpose_methods[int(angle), mirror, flip]
+            if method is None:
+                return image.copy()
+            return image.transpose(getattr(_Transpose, method))
         ret = image
-        if self.mirror:
+        if mirror and flip:
+            ret = ret.transpose(_Transpose.ROTATE_180)
+        elif mirror:
             ret = ImageOps.mirror(ret)
-        if self.flip:
+        elif flip:
             ret = ImageOps.flip(ret)
         ret = ret.rotate(-self.rotate, expand=True)
         return ret
 
+    def _get_rotated_hr(self, hr=None):
+        """Get the rotated :attr:`highres_image`
+
+        The rotated image is cached as long as the :attr:`highres_image`,
+        :attr:`rotate`, :attr:`mirror` and :attr:`flip` do not change.
+
+        Parameters
+        ----------
+        hr: PIL.Image.Image
+            The :attr:`highres_image`. If None, it is taken from this reader
+
+        Returns
+        -------
+        PIL.Image.Image
+            The rotated `hr` (see :meth:`rotate_image`)"""
+        if hr is None:
+            hr = self.highres_image
+        return self._rotate_cached('hr', hr)
+
+    def _rotate_cached(self, key, image):
+        """Rotate an image and cache the result
+
+        Parameters
+        ----------
+        key: str
+            The name of the image in the :attr:`_rotated_cache`
+        image: PIL.Image.Image
+            The image to rotate
+
+        Returns
+        -------
+        PIL.Image.Image
+            The rotated `image` (see :meth:`rotate_image`). It is reused as
+            long as `image`, :attr:`rotate`, :attr:`mirror` and :attr:`flip`
+            do not change"""
+        state = (self.rotate, self.mirror, self.flip)
+        cached = self._rotated_cache.get(key)
+        if cached is not None and cached[0] is image and cached[1:-1] == state:
+            return cached[-1]
+        ret = self.rotate_image(image)
+        self._rotated_cache[key] = (image, ) + state + (ret, )
+        return ret
+
     def recognize_text(self, image):
         """Recognize the text in an image using tesserocr
 
@@ -574,7 +773,87 @@ class ColNamesReader(object):
         if image.mode == 'RGBA':
             image = rgba2rgb(image)
 
-        return tesserocr.image_to_text(image).strip().replace('\n', ' ')
+        return self._image_to_text(image).strip().replace('\n', ' ')
+
+    def _image_to_text(self, image):
+        """Read the text in an image with the :attr:`tess_api`
+
+        Images that have already been read by this reader are taken from the
+        :attr:`_ocr_cache`"""
+        cache = self._ocr_cache
+        key = _image_key(image)
+        try:
+            text = cache[key]
+        except KeyError:
+            api = self.tess_api
+            api.SetImage(image)
+            text = api.GetUTF8Text()
+            api.Clear()
+            api.ClearAdaptiveClassifier()
+            cache[key] = text
+            while len(cache) > self.ocr_cache_size:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(key)
+        return text
+
+    def _get_text_lines(self, source, extents=None):
+        """Find the text lines in an image with tesseract
+
+        The result is cached, such that repeated calls for the same `source`
+        and `extents` do not have to analyse the layout again.
+
+        Parameters
+        ----------
+        source: PIL.Image.Image
+            The RGBA image to search for text lines
+        extents: list of floats (x0, y0, x1, y1)
+            The extents to crop the `source`. If None, the entire `source` is
+            used
+
+        Returns
+        -------
+        PIL.Image.Image
+            The cropped `source`
+        PIL.Image.Image
+            The cropped `source` as RGB image (see
+            :func:`straditize.common.rgba2rgb`)
+        PIL.Image.Image
+            The grayscale version of the RGB image that is used for the text
+            recognition
+        list of tuples ``(box, border)``
+            The :class:`Bbox` of each text line in the cropped image and the
+            width of the white border to add for the text recognition"""
+        key = None if extents is None else tuple(extents)
+        cached = self._text_lines_cache
+        if cached is not None and cached[0] is source and cached[1] == key:
+            return cached[2:]
+        image = source if extents is None else source.crop(extents)
+        rgb = rgba2rgb(image)
+        # tesseract works on grayscale images anyway, so we pass them
+        # directly instead of letting tesseract convert them
+        gray = rgb.convert('L')
+        # the layout analysis of tesseract scales with the size of the image.
+        # The rotated image, however, is mostly white, so we only pass the
+        # part with content (plus a small margin) to tesseract
+        content = ImageOps.invert(gray).getbbox()
+        lines = []
+        if content is not None:
+            margin = 10
+            content = (
+                max(content[0] - margin, 0), max(content[1] - margin, 0),
+                min(content[2] + margin, rgb.size[0]),
+                min(content[3] + margin, rgb.size[1]))
+            api = self.tess_api
+            api.SetImage(gray.crop(content))
+            im_boxes = api.GetComponentImages(tesserocr.RIL.TEXTLINE, True)
+            api.Clear()
+            lines = [(Bbox(d['x'] + content[0], d['y'] + content[1],
+                           d['w'], d['h']),
+                      int(im.size[1] / 2.))
+                     for im, d, _, _ in im_boxes]
+        self._text_lines_cache = (source, key, image, rgb, gray, lines)
+        return image, rgb, gray, lines
 
     def find_colnames(self, extents=None):
         """Find the names for the columns using tesserocr
@@ -596,15 +875,22 @@ class ColNamesReader(object):
             A mapping from column number to a :class:`Bbox` (the bounding box
             of the corresponding column name)"""
 
-        def get_overlap(col, box):
-            s, e = bounds[col]
-            x0, y0 = extents[:2]
-            xmin = self.transform_point(
-                box.x0 + x0, box.y0 + y0, invert=True, image=hr)[0]
-            xmax = self.transform_point(
-                box.x0 + x0, box.y1 + y0, invert=True, image=hr)[0]
-            xmin, xmax = sorted([xmin, xmax])
-            return max(min(e, xmax) - max(s, xmin), 0)
+        def get_overlaps(boxes):
+            """Get the overlap of the `boxes` with each column
+
+            The boxes are transformed to the coordinate system of `hr` (see
+            :meth:`transform_point`) and the result is an array of shape
+            ``(ncols, len(boxes))``"""
+            arr = np.array([[b.x0, b.y0, b.y1] for b in boxes],
+                           dtype=float).reshape((-1, 3))
+            x = cos * (arr[:, :1] + x0 - dx)
+            xlims = x + sin * (arr[:, 1:] + y0)
+            if self.mirror:
+                xlims = xs_hr - xlims
+            xlims.sort(axis=1)
+            return np.maximum(
+                np.minimum(bounds[:, 1:], xlims[:, 1]) -
+                np.maximum(bounds[:, :1], xlims[:, 0]), 0)
 
         def vbox_distance(b1, b2):
             if b1.left > b2.right or b1.right < b2.left:
@@ -614,84 +900,84 @@ class ColNamesReader(object):
         if tesserocr is None:
             raise ImportError("tesserocr module not found!")
 
-        bounds = self.column_bounds
-        cols = list(range(len(bounds)))
-        rotated = self.rotated_image
+        bounds = np.asarray(self.column_bounds)
         hr = self.highres_image
-        rotated_hr = self.rotate_image(hr)
-        fx, fy = np.round(
-            np.array(rotated_hr.size) / rotated.size).astype(int)
-        bounds = bounds * fx
+        rotated_hr = self._get_rotated_hr(hr)
+        if hr.size == self.image.size:
+            # no high resolution image, so we do not need to rotate the
+            # original image as well
+            fx = fy = 1
+        else:
+            rotated = self.rotated_image
+            fx, fy = np.round(
+                np.array(rotated_hr.size) / rotated.size).astype(int)
+            bounds = bounds * fx
+
+        # parameters to transform the boxes in the rotated image back to the
+        # x-coordinate system of hr (see transform_point)
+        angle = np.deg2rad(self.rotate)
+        cos, sin = np.cos(angle), np.sin(angle)
+        xs_hr, ys_hr = hr.size
+        dx = ys_hr * sin
 
         if extents is None:
-            image = rotated_hr
             x0 = y0 = 0
         else:
-            extents = np.asarray(extents)
+            extents = np.array(extents)
             extents[::2] *= fx
             extents[1::2] *= fy
-            image = rotated_hr.crop(extents)
-
-            x0, y0 = self.transform_point(
-                *extents[:2], image=hr,
-                invert=True)
-
-        if tesseract_version.startswith('4.0.'):
-            # LC_ALL might have been changed by some other module, so we set
-            # it here again to "C"
-            import locale
-            locale.setlocale(locale.LC_ALL, 'C')
+            x0, y0 = extents[:2]
 
-        with tesserocr.PyTessBaseAPI() as api:
-            api.SetImage(rgba2rgb(image))
-            im_boxes = api.GetComponentImages(tesserocr.RIL.TEXTLINE, True)
-            texts = {}
-            images = {}
-            for i, (im, d, _, _) in enumerate(im_boxes):
-                box = Bbox(**d)
-                if not any(get_overlap(col, box) for col in cols):
-                    continue
-                # expand the image to improve text recognition
-                im = ImageOps.expand(rgba2rgb(image.crop(box.crop_extents)),
-                                     int(im.size[1] / 2.), (255, 255, 255))
-                text = tesserocr.image_to_text(im).strip()
-                if len(text) >= 3:
-                    texts[box] = text
-                    images[box] = im.convert('RGBA')
+        image, rgb, gray, lines = self._get_text_lines(rotated_hr, extents)
+        if not lines:
+            return {}, {}, {}
+        texts = {}
+        images = {}
+        all_boxes = [box for box, _ in lines]
+        has_overlap = get_overlaps(all_boxes).any(axis=0)
+        for (box, border), keep in zip(lines, has_overlap):
+            if not keep:
+                continue
+            # expand the image to improve text recognition
+            text = self._image_to_text(ImageOps.expand(
+                gray.crop(box.crop_extents), border, 255)).strip()
+            if len(text) >= 3:
+                texts[box] = text
+                images[box] = ImageOps.expand(
+                    rgb.crop(box.crop_extents), border,
+                    (255, 255, 255)).convert('RGBA')
 
         if not texts:
             return {}, {}, {}
 
-        # merge boxes that are closer than one 1em
+        # merge boxes that are closer than one 1em. We therefore go through
+        # the boxes of each column from top to bottom and merge each box with
+        # the one below
         em = min(b.h for b in texts)
-        merged = {None}
-        while merged:
-            merged = set()
-            for b1, t in list(texts.items()):
-                if b1 in merged:
-                    continue
-                col = max(cols, key=partial(get_overlap, box=b1))
-                for b2, t in list(texts.items()):
-                    if (b1 is b2 or b2 in merged or not get_overlap(col, b2) or
-                            vbox_distance(b1, b2) > 0.5*em):
-                        continue
-                    merged.update([b1, b2])
-                    box = Bbox(min(b1.x, b2.x), min(b1.y, b2.y),
-                               max(b1.x1, b2.x1) - min(b1.x0, b2.x0),
-                               max(b1.y0, b2.y0) - min(b1.y1, b2.y1))
-                    texts[box] = texts[b1] + (
-                        ' ' if not texts[b1].endswith('-') else '') + texts[b2]
-                    images[box] = image.crop(box.crop_extents)
-                    b1 = box
-            for b in merged:
+        all_boxes = list(texts)
+        box_cols = get_overlaps(all_boxes).argmax(axis=0)
+        b1 = col = None
+        for b2, col2 in sorted(zip(all_boxes, box_cols),
+                               key=lambda t: (t[1], t[0].top)):
+            if b1 is None or col2 != col or vbox_distance(b1, b2) > 0.5*em:
+                b1, col = b2, col2
+                continue
+            box = Bbox(min(b1.x, b2.x), min(b1.y, b2.y),
+                       max(b1.x1, b2.x1) - min(b1.x0, b2.x0),
+                       max(b1.y0, b2.y0) - min(b1.y1, b2.y1))
+            texts[box] = texts[b1] + (
+                ' ' if not texts[b1].endswith('-') else '') + texts[b2]
+            images[box] = image.crop(box.crop_extents)
+            for b in [b1, b2]:
                 del texts[b], images[b]
+            b1 = box
 
         # get a mapping from box to column from the overlap
-        boxes = dict(filter(
-            lambda t: get_overlap(*t),
-            ((col, max(texts, key=partial(get_overlap, col)))
-             for col in range(len(bounds)))))
-        x0, y0 = extents[:2]
+        all_boxes = list(texts)
+        overlaps = get_overlaps(all_boxes)
+        boxes = {col: all_boxes[i]
+                 for col, i in enumerate(overlaps.argmax(axis=1))
+                 if overlaps[col, i]}
 
         return (
             {col: texts[box] for col, box in boxes.items()},
@@ -31,7 +31,8 @@ def rgba2rgb(image, color=(255, 255, 255)):
     Parameters
     ----------
     image: PIL.Image
-        The PIL RGBA Image object
+        The PIL RGBA Image object. Images without alpha channel are only
+        converted to RGB (if necessary)
     color: tuple
         The rgb color for the background
 
@@ -41,7 +42,14 @@ def rgba2rgb(image, color=(255, 255, 255)):
         The rgb image
     """
     from PIL import Image
-    image.load()  # needed for split()
+    if 'A' not in image.getbands():
+        # nothing to composite
+        return image if image.mode == 'RGB' else image.convert('RGB')
+    image.load()  # needed for getchannel()
+    alpha = image.getchannel('A')
+    if alpha.getextrema() == (255, 255):
+        # fully opaque, so there is nothing to composite
+        return image.convert('RGB')
     background = Image.new('RGB', image.size, color)
-    background.paste(image, mask=image.split()[3])  # 3 is the alpha channel
+    background.paste(image, mask=alpha)
     return background
@@ -17,17 +17,36 @@ GNU General Public License for more details.
 
 You should have received a copy of the GNU General Public License
 along with this program. If not, see <https://www.gnu.org/licenses/>."""
+import time
 import numpy as np
-import six
 from psyplot.data import Signal
 from psyplot.utils import _temp_bool_prop
-from itertools import chain, repeat, product
+from itertools import chain, repeat, product, zip_longest
 from straditize.common import docstrings
 
-if six.PY2:
-    from itertools import izip_longest as zip_longest
-else:
-    from itertools import zip_longest
+
+def _get_nearest(index, value):
+    """Get the value of a monotonic index that is closest to `value`
+
+    Parameters
+    ----------
+    index: pandas.Index or np.ndarray
+        The monotonic increasing or decreasing index
+    value: float
+        The value to look for
+
+    Returns
+    -------
+    float
+        The element in `index` that is the closest to `value`"""
+    values = np.asarray(index)
+    if len(values) > 1 and values[0] > values[-1]:
+        values = values[::-1]
+    i = values.searchsorted(value)
+    if i == len(values) or (
+            i > 0 and abs(values[i - 1] - value) < abs(values[i] - value)):
+        i -= 1
+    return values[i]
 
 
 class CrossMarks(object):
@@ -85,27 +104,32 @@ class CrossMarks(object):
     @property
     def points(self):
         """The x-y-coordinates of the points as a (N, 2)-shaped array"""
-        return np.array(list(product(self.xa, self.ya)))
+        xa = self.xa
+        ya = self.ya
+        ret = np.empty((xa.size * ya.size, 2), dtype=xa.dtype)
+        ret[:, 0] = np.repeat(xa, ya.size)
+        ret[:, 1] = np.tile(ya, xa.size)
+        return ret
 
     @property
     def line_connections(self):
         """The line connections to the current position"""
-        return self._all_line_connections[self._i_hline][self._i_vline]
+        return self._all_line_connections[self._i_hline, self._i_vline]
 
     @line_connections.setter
     def line_connections(self, value):
         """The line connections to the current position"""
-        self._all_line_connections[self._i_hline][self._i_vline] = value
+        self._all_line_connections[self._i_hline, self._i_vline] = value
 
     @property
     def other_connections(self):
         """All other connections to the current position"""
-        return self._all_other_connections[self._i_hline][self._i_vline]
+        return self._all_other_connections[self._i_hline, self._i_vline]
 
     @other_connections.setter
     def other_connections(self, value):
         """All other connections to the current position"""
-        self._all_other_connections[self._i_hline][self._i_vline] = value
+        self._all_other_connections[self._i_hline, self._i_vline] = value
 
     @property
     def idx_h(self):
@@ -155,6 +179,32 @@ class CrossMarks(object):
     #: used
     _animated = True
 
+    #: The minimal time in seconds between two redraws while the mark is
+    #: dragged. Motion events that arrive earlier are deferred and only the
+    #: latest one is processed by a timer of the canvas. This is only
+    #: possible for interactive canvases that support timers. If 0 (the
+    #: default), every motion event is processed immediately
+    motion_interval = 0
+
+    #: The time of the last processed motion event
+    _last_motion_t = 0.0
+
+    #: The latest motion event that has been deferred by :meth:`on_motion`
+    _pending_motion = None
+
+    #: The canvas timer to process the :attr:`_pending_motion`. False, if the
+    #: canvas does not support timers
+    _motion_timer = None
+
+    #: One percent of the x- and y-range of the axes. Used to snap the mark
+    #: to other marks in :meth:`on_motion`
+    _one_percent = None
+
+    #: The (N, 2)-shaped positions of the :attr:`other_marks` on the same
+    #: axes. They are determined in :meth:`on_press` and used for snapping in
+    #: :meth:`on_motion`
+    _snap_pos = np.zeros((0, 2))
+
     #: The matplotlib axes to plot on
     ax = None
 
@@ -246,10 +296,11 @@ class CrossMarks(object):
                              dtype=float)
         self._xa0 = self.xa.copy()
         self._ya0 = self.ya.copy()
-        self._constant_dist_x = []
+        self._constant_dist_x = np.zeros(0)
         self._constant_dist_x_marks = []
-        self._constant_dist_y = []
+        self._constant_dist_y = np.zeros(0)
         self._constant_dist_y_marks = []
+        self._constant_dist_marks = ()
         self.selectable = list(selectable)
         self.draggable = list(draggable)
         if hide_horizontal is not None:
@@ -274,10 +325,8 @@ class CrossMarks(object):
         self.ylim = ylim
         self.other_marks = []
         self._connection_visible = []
-        self._all_line_connections = [[[] for _ in range(len(self.xa))]
-                                      for _ in range(len(self.ya))]
-        self._all_other_connections = [[[] for _ in range(len(self.xa))]
-                                       for _ in range(len(self.ya))]
+        self._all_line_connections = self._empty_connections()
+        self._all_other_connections = self._empty_connections()
         self._lock_mark = lock
         kwargs.setdefault('marker', '+')
         self.auto_hide = auto_hide
@@ -290,6 +339,19 @@ class CrossMarks(object):
         elif ax is not None:
             self.ax = ax
 
+    def _empty_connections(self):
+        """Create an empty (len(ya), len(xa))-shaped array of connections
+
+        Returns
+        -------
+        np.ndarray of dtype object
+            An array with one (empty) list per point for the connected lines
+        """
+        ret = np.empty((len(self.ya), len(self.xa)), dtype=object)
+        for i, j in product(range(len(self.ya)), range(len(self.xa))):
+            ret[i, j] = []
+        return ret
+
     def set_connected_artists(self, artists):
         """Set the connected artists
 
@@ -297,11 +359,15 @@ class CrossMarks(object):
         ----------
         artists: matplotlib.artist.Artist
             The artists (e.g. other lines) that should be connected and
-            highlighted if this mark is selected"""
+            highlighted if this mark is selected
+
+        Notes
+        -----
+        The current properties of the artists are only stored when the mark
+        is selected for the first time (see :meth:`on_press`). They are
+        restored when the mark is released"""
         self.connected_artists = artists
-        self._connected_artists_props = [
-            {key: getattr(a, 'get_' + key)() for key in self._select_props}
-            for a in artists]
+        self._connected_artists_props = [None] * len(artists)
 
     def draw_lines(self, **kwargs):
         """Draw the vertical and horizontal lines
@@ -333,26 +399,31 @@ class CrossMarks(object):
         xmax = max(xlim)
         ymin = min(ylim)
         ymax = max(ylim)
+        # the x-data of the horizontal and the y-data of the vertical lines.
+        # We reuse these arrays to avoid reallocating them for every motion
+        # event. The lines keep their own copy, so every change has to be
+        # passed to them via set_xdata/set_ydata
+        self._hline_x = np.r_[[xmin], self.xa, [xmax]]
+        self._vline_y = np.r_[[ymin], self.ya, [ymax]]
         xy = zip(repeat(self.xa), self.ya)
         x, y = next(xy)
         # we plot the first separate line to get the correct color
-        line = self.ax.plot(np.r_[[xmin], x, [xmax]],
-                            [y] * (len(x) + 2), markevery=slice(1, len(x) + 1),
+        line = self.ax.plot(self._hline_x, np.full(len(x) + 2, y),
+                            markevery=slice(1, len(x) + 1),
                             label='cross_mark_hline',
                             visible=not self.hide_horizontal, **kwargs)[0]
         if 'color' not in kwargs and 'c' not in kwargs:
             kwargs['c'] = line.get_c()
         # now the rest of the horizontal lines
         self.hlines = [line] + [
-            self.ax.plot(np.r_[[xmin], x, [xmax]],
-                         [y] * (len(x) + 2), markevery=slice(1, len(x) + 1),
+            self.ax.plot(self._hline_x, np.full(len(x) + 2, y),
+                         markevery=slice(1, len(x) + 1),
                          label='cross_mark_hline',
                          visible=not self.hide_horizontal, **kwargs)[0]
             for x, y in xy]
         # and the vertical lines
         self.vlines = [
-            self.ax.plot([x] * (len(y) + 2),
-                         np.r_[[ymin], y, [ymax]],
+            self.ax.plot(np.full(len(y) + 2, x), self._vline_y,
                          markevery=slice(1, len(y) + 1),
                          label='cross_mark_vline',
                          visible=not self.hide_vertical, **kwargs)[0]
@@ -432,9 +503,10 @@ class CrossMarks(object):
         marks: list of CrossMarks
             A list of other marks. If this mark is moved vertically, the others
             are, too"""
-        y = self.y
-        self._constant_dist_y.extend(m.y - y for m in marks)
+        ys = np.fromiter((m.y for m in marks), float, len(marks))
+        self._constant_dist_y = np.r_[self._constant_dist_y, ys - self.y]
         self._constant_dist_y_marks.extend(marks)
+        self._update_constant_dist_marks()
 
     @staticmethod
     def maintain_x(marks):
@@ -456,9 +528,15 @@ class CrossMarks(object):
         marks: list of CrossMarks
             A list of other marks. If this mark is moved horizontally, the
             others are, too"""
-        x = self.x
-        self._constant_dist_x.extend(m.x - x for m in marks)
+        xs = np.fromiter((m.x for m in marks), float, len(marks))
+        self._constant_dist_x = np.r_[self._constant_dist_x, xs - self.x]
         self._constant_dist_x_marks.extend(marks)
+        self._update_constant_dist_marks()
+
+    def _update_constant_dist_marks(self):
+        """Update the unique marks that maintain a constant distance"""
+        self._constant_dist_marks = tuple(dict.fromkeys(chain(
+            self._constant_dist_y_marks, self._constant_dist_x_marks)))
 
     def connect_to_marks(self, marks, visible=False, append=True):
         """Append other marks that should be considered for aligning the lines
@@ -483,22 +561,20 @@ class CrossMarks(object):
             self.other_marks.extend(marks)
             self._connection_visible.extend([visible] * len(marks))
         if visible:
-            ya = self.ya
-            xa = self.xa
             ax = self.ax
             for m in marks:
-                for i1, j1 in product(range(len(xa)), range(len(ya))):
-                    self.set_current_point(i1, j1)
-                    pos = self.pos
-                    for i2, j2 in product(range(len(m.xa)), range(len(m.ya))):
-                        m.set_current_point(i2, j2)
-                        line = ax.plot([pos[0], m.pos[0]], [pos[1], m.pos[1]],
+                for (i1, x1), (j1, y1) in product(enumerate(self.xa),
+                                                  enumerate(self.ya)):
+                    line_connections = self._all_line_connections[j1, i1]
+                    for (i2, x2), (j2, y2) in product(enumerate(m.xa),
+                                                      enumerate(m.ya)):
+                        line = ax.plot([x1, x2], [y1, y2],
                                        label='cross_mark_connection',
                                        **self._unselect_props)[0]
                         if self.auto_hide:
                             line.set_lw(0)
-                        self.line_connections.append(line)
-                        m.other_connections.append(line)
+                        line_connections.append(line)
+                        m._all_other_connections[j2, i2].append(line)
 
     @staticmethod
     def connect_marks(marks, visible=False):
@@ -528,6 +604,22 @@ class CrossMarks(object):
             'button_release_event', self.on_release)
         self.cidmotion = fig.canvas.mpl_connect(
             'motion_notify_event', self.on_motion)
+        self._update_one_percent()
+        self._cids_lim = [
+            self.ax.callbacks.connect(key, self._update_one_percent)
+            for key in ['xlim_changed', 'ylim_changed']]
+
+    def _update_one_percent(self, ax=None):
+        """Update one percent of the x- and y-range of the axes
+
+        Parameters
+        ----------
+        ax: matplotlib.axes.Axes
+            The axes whose limits changed. This parameter is ignored and
+            only there to be used as a callback of the axes"""
+        xmin, xmax = self.ax.get_xlim()
+        ymin, ymax = self.ax.get_ylim()
+        self._one_percent = (0.01 * abs(xmax - xmin), 0.01 * abs(ymax - ymin))
 
     def is_selected_by(self, event, buttons=[1]):
         """Test if the given `event` selects the mark
@@ -584,6 +676,11 @@ class CrossMarks(object):
         if not force and not self.is_selected_by(event):
             return
         self.set_current_point(event.xdata, event.ydata, True)
+        self._last_motion_t = 0.0
+        self._pending_motion = None
+        self._snap_pos = np.array(
+            [m.pos for m in self.other_marks if m.ax is self.ax]).reshape(
+                (-1, 2))
         # use only the upper most CrossMarks
         if self._lock_mark and connected:
             CrossMarks.lock = self
@@ -600,15 +697,19 @@ class CrossMarks(object):
             a.update(artist_props)
 
         # toggle connected artists
+        props = self._connected_artists_props
+        for i, (d, a) in enumerate(zip(props, self.connected_artists)):
+            if d is None:
+                props[i] = {key: getattr(a, 'get_' + key)()
+                            for key in self._select_props}
         artist_props['visible'] = (
             self.show_connected_artists and artist_props.get('visible', True))
         for a in self.connected_artists:
             a.update(artist_props)
-        self.press = self.pos[0], self.pos[1], event.xdata, event.ydata
+        self.press = tuple(self.pos) + (event.xdata, event.ydata)
         # select the connected marks that should maintain the distance
         if connected:
-            for m in set(chain(self._constant_dist_y_marks,
-                               self._constant_dist_x_marks)):
+            for m in self._constant_dist_marks:
                 m._i_vline = self._i_vline
                 m._i_hline = self._i_hline
                 event.xdata, event.ydata = m.pos
@@ -653,79 +754,94 @@ class CrossMarks(object):
             If True, connected marks that should maintain a constant x- and
             y-distance are moved, too
         restore: bool
-            If True, the axes background is restored"""
+            If True, the axes background is restored and the canvas is
+            updated after the connected marks have been moved. Otherwise, the
+            artists are only drawn and the canvas has to be updated by the
+            caller"""
         if self.press is None or (not force and self._lock_mark and
                                   self.lock is not self):
             return
         if not force and event.inaxes != self.ax:
             return
+        if not force and self.motion_interval:
+            t = time.monotonic()
+            if (t - self._last_motion_t < self.motion_interval and
+                    self._defer_motion(event)):
+                return
+            self._last_motion_t = t
+            self._pending_motion = None
         x0, y0, xpress, ypress = self.press
         dx = event.xdata - xpress
         dy = event.ydata - ypress
         canvas = self.fig.canvas
+        ax = self.ax
+        # the currently selected lines
+        i_h, i_v = self._i_hline, self._i_vline
+        hline = self.hlines[i_h]
+        vline = self.vlines[i_v]
+        if self._one_percent is None:
+            self._update_one_percent()
 
         if dy and 'h' in self.draggable:
             y1 = y0 + dy
-            one_percent = np.abs(0.01 * np.diff(self.ax.get_ylim())[0])
-            for mark in filter(lambda m: m.ax is self.ax, self.other_marks):
-                if np.abs(mark.pos[1] - y1) < one_percent:
-                    y1 = mark.pos[1]
-                    break
+            one_percent = self._one_percent[1]
+            close = np.flatnonzero(
+                np.abs(self._snap_pos[:, 1] - y1) < one_percent)
+            if close.size:
+                y1 = self._snap_pos[close[0], 1]
             if self.idx_v is not None:
-                y1 = self.idx_v[self.idx_v.get_loc(y1, method='nearest')]
-            self.hline.set_ydata([y1] * len(self.hline.get_ydata()))
-            self.y = y1
+                y1 = _get_nearest(self.idx_v, y1)
+            hline.set_ydata(np.full(len(self._hline_x), y1))
+            self.ya[i_h] = y1
             # first we move the horizontal line that is associated with this
             # mark
-            ydata = self.vline.get_ydata()[:]
-            ydata[self._i_hline + 1] = y1
+            self._vline_y[i_h + 1] = y1
             for l in self.vlines:
-                l.set_ydata(ydata)
+                l.set_ydata(self._vline_y)
             # now we move all connections that are connected to this horizontal
             # layer
             for l in chain.from_iterable(
-                    self._all_line_connections[self._i_hline]):
+                    self._all_line_connections[i_h, :]):
                 l.set_ydata([y1, l.get_ydata()[1]])
             for l in chain.from_iterable(
-                    self._all_other_connections[self._i_hline]):
+                    self._all_other_connections[i_h, :]):
                 l.set_ydata([l.get_ydata()[0], y1])
         if dx and 'v' in self.draggable:
             x1 = x0 + dx
-            one_percent = np.abs(0.01 * np.diff(self.ax.get_xlim())[0])
-            for mark in filter(lambda m: m.ax is self.ax, self.other_marks):
-                if np.abs(mark.pos[0] - x1) < one_percent:
-                    x1 = mark.pos[0]
-                    break
+            one_percent = self._one_percent[0]
+            close = np.flatnonzero(
+                np.abs(self._snap_pos[:, 0] - x1) < one_percent)
+            if close.size:
+                x1 = self._snap_pos[close[0], 0]
             if self.idx_h is not None:
-                x1 = self.idx_h[self.idx_h.get_loc(x1, method='nearest')]
-            self.vline.set_xdata([x1] * len(self.vline.get_xdata()))
-            self.x = x1
+                x1 = _get_nearest(self.idx_h, x1)
+            vline.set_xdata(np.full(len(self._vline_y), x1))
+            self.xa[i_v] = x1
             # first we move the vertical line that is associated with this mark
-            xdata = self.hline.get_xdata()[:]
-            xdata[self._i_vline + 1] = x1
+            self._hline_x[i_v + 1] = x1
             for l in self.hlines:
-                l.set_xdata(xdata)
+                l.set_xdata(self._hline_x)
             # now we move all connections that are connected to this vertical
             # layer
             for l in chain.from_iterable(
-                    l[self._i_vline] for l in self._all_line_connections):
+                    self._all_line_connections[:, i_v]):
                 l.set_xdata([x1, l.get_xdata()[1]])
             for l in chain.from_iterable(
-                    l[self._i_vline] for l in self._all_other_connections):
+                    self._all_other_connections[:, i_v]):
                 l.set_xdata([l.get_xdata()[0], x1])
         if restore and self._animated:
             canvas.restore_region(self.background)
-        for l in chain(self.other_connections, self.line_connections,
+        for l in chain(self._all_other_connections[i_h, i_v],
+                       self._all_line_connections[i_h, i_v],
                        self.connected_artists):
-            self.ax.draw_artist(l)
-        if restore and self._animated:
-            self.ax.draw_artist(self.hline)
-            self.ax.draw_artist(self.vline)
-            canvas.blit(self.ax.bbox)
-        else:
-            self.ax.figure.canvas.draw_idle()
+            ax.draw_artist(l)
+        if self._animated:
+            ax.draw_artist(hline)
+            ax.draw_artist(vline)
 
-        # move the marks that should maintain a constant distance
+        # move the marks that should maintain a constant distance. Marks on
+        # the same axes only draw their artists and we update the canvas
+        # once afterwards
         orig_xy = (event.xdata, event.ydata)
         if move_connected and dy and 'h' in self.draggable:
             for dist, m in zip(self._constant_dist_y,
@@ -741,6 +857,54 @@ class CrossMarks(object):
                 m.on_motion(event, True, False, m.ax is not self.ax)
         event.xdata, event.ydata = orig_xy
 
+        if restore:
+            if self._animated:
+                canvas.blit(ax.bbox)
+            else:
+                canvas.draw_idle()
+
+    def _defer_motion(self, event):
+        """Defer the processing of a motion event
+
+        Parameters
+        ----------
+        event: matplotlib.backend_bases.MouseEvent
+            The mouseevent that shall be processed by :meth:`_flush_motion`
+            once the :attr:`motion_interval` has passed
+
+        Returns
+        -------
+        bool
+            False, if the canvas does not support timers (e.g. for the agg
+            backend) and the `event` has to be processed immediately"""
+        from matplotlib.backend_bases import TimerBase
+        if self._motion_timer is None:
+            timer = self.fig.canvas.new_timer(
+                interval=int(self.motion_interval * 1000))
+            if type(timer)._timer_start is TimerBase._timer_start:
+                # the timer would never fire, so we remember that it is not
+                # supported
+                self._motion_timer = False
+            else:
+                timer.single_shot = True
+                timer.add_callback(self._flush_motion)
+                self._motion_timer = timer
+        if not self._motion_timer:
+            return False
+        start = self._pending_motion is None
+        self._pending_motion = event
+        if start:
+            self._motion_timer.start()
+        return True
+
+    def _flush_motion(self):
+        """Process the last motion event that has been deferred"""
+        event = self._pending_motion
+        if event is not None:
+            self._pending_motion = None
+            self._last_motion_t = 0.0
+            self.on_motion(event)
+
     def set_connected_artists_visible(self, visible):
         """Set the visibility of the connected artists
 
@@ -752,7 +916,8 @@ class CrossMarks(object):
         for a in self.connected_artists:
             a.set_visible(visible)
         for d in self._connected_artists_props:
-            d['visible'] = visible
+            if d is not None:
+                d['visible'] = visible
 
     def on_release(self, event, force=False, connected=True, draw=True,
                    *args, **kwargs):
@@ -769,18 +934,21 @@ class CrossMarks(object):
             If True, connected marks that should maintain a constant x- and
             y-distance are released, too
         draw: bool
-            If True, the figure is drawn
+            If True, the figure is drawn. The figures of the connected marks
+            are drawn in any case
         ``*args, **kwargs``
             Any other parameter that is passed to the connected lines"""
         if (not force and self._lock_mark and self.lock is not self or
                 self.press is None):
             return
+        self._flush_motion()
         self.hline.update(self._unselect_props)
         self.vline.update(self._unselect_props)
         for d, a in zip_longest(self._connected_artists_props,
                                 self.connected_artists,
                                 fillvalue=self._unselect_props):
-            a.update(d)
+            if d is not None:
+                a.update(d)
         for l in chain(self.line_connections, self.other_connections):
             l.update(self._unselect_props)
         if self.auto_hide:
@@ -799,15 +967,20 @@ class CrossMarks(object):
             self.hline.set_animated(False)
             self.vline.set_animated(False)
             self.background = None
+        # the connected marks do not draw themselves. Instead, we draw every
+        # other figure (e.g. the magnifier) once at the end
+        figs = []
         if connected:
-            for m in set(chain(self._constant_dist_y_marks,
-                               self._constant_dist_x_marks)):
-                m.on_release(event, True, False, m.fig is not self.fig,
-                             *args, **kwargs)
+            for m in self._constant_dist_marks:
+                m.on_release(event, True, False, False, *args, **kwargs)
+                if m.fig is not self.fig and m.fig not in figs:
+                    figs.append(m.fig)
         if self._lock_mark and self.lock is self:
             CrossMarks.lock = None
         if draw:
             self.fig.canvas.draw_idle()
+        for fig in figs:
+            fig.canvas.draw_idle()
         self.moved.emit(pos0, self)
 
     def disconnect(self):
@@ -816,6 +989,13 @@ class CrossMarks(object):
         fig.canvas.mpl_disconnect(self.cidpress)
         fig.canvas.mpl_disconnect(self.cidrelease)
         fig.canvas.mpl_disconnect(self.cidmotion)
+        for cid in self._cids_lim:
+            self.ax.callbacks.disconnect(cid)
+        self._one_percent = None
+        if self._motion_timer:
+            self._motion_timer.stop()
+            self._motion_timer = None
+        self._pending_motion = None
 
     def remove(self, artists=True):
         """Remove all lines and disconnect the mark
@@ -827,10 +1007,8 @@ class CrossMarks(object):
             corresponding artists are removed as well"""
         for l in chain(self.hlines, self.vlines,
                        self.connected_artists if artists else [],
-                       chain.from_iterable(chain.from_iterable(
-                           self._all_other_connections)),
-                       chain.from_iterable(chain.from_iterable(
-                           self._all_line_connections))):
+                       chain.from_iterable(self._all_other_connections.flat),
+                       chain.from_iterable(self._all_line_connections.flat)):
             try:
                 l.remove()
             except ValueError:
@@ -844,23 +1022,19 @@ class CrossMarks(object):
         visible_connections = [
             m for m, v in zip(self.other_marks, self._connection_visible) if v]
         for m in visible_connections:
-            for l in chain.from_iterable(chain.from_iterable(
-                    self._all_line_connections)):
-                for i, j in product(range(len(m.ya)), range(len(m.xa))):
-                    if l in m._all_other_connections[i][j]:
-                        m._all_other_connections[i][j].remove(l)
+            for l in chain.from_iterable(self._all_line_connections.flat):
+                for connections in m._all_other_connections.flat:
+                    if l in connections:
+                        connections.remove(l)
                         break
-            for l in chain.from_iterable(chain.from_iterable(
-                    self._all_other_connections)):
-                for i, j in product(range(len(m.ya)), range(len(m.xa))):
-                    if l in m._all_line_connections[i][j]:
-                        m._all_line_connections[i][j].remove(l)
+            for l in chain.from_iterable(self._all_other_connections.flat):
+                for connections in m._all_line_connections.flat:
+                    if l in connections:
+                        connections.remove(l)
                         break
 
-        self._all_line_connections = [[[] for _ in range(len(self.xa))]
-                                      for _ in range(len(self.ya))]
-        self._all_other_connections = [[[] for _ in range(len(self.xa))]
-                                       for _ in range(len(self.ya))]
+        self._all_line_connections = self._empty_connections()
+        self._all_other_connections = self._empty_connections()
 
         self.disconnect()
 
@@ -872,6 +1046,10 @@ class CrossMarks(object):
         pos: tuple of 2 arrays
             The positions of the crosses. The first item marks the
             x-coordinates of the points, the second the y-coordinates"""
+        if self.hlines:
+            # the lines are already drawn, so we only update their data
+            self._move_lines(pos)
+            return
         self.remove(artists=False)
         self.xa[:] = pos[0]
         self.ya[:] = pos[1]
@@ -882,6 +1060,30 @@ class CrossMarks(object):
         if visible_connections:
             self.connect_to_marks(visible_connections, True, append=False)
 
+    def _move_lines(self, pos):
+        """Move the drawn lines and connections to another position
+
+        Parameters
+        ----------
+        pos: tuple of 2 arrays
+            The positions of the crosses. The first item marks the
+            x-coordinates of the points, the second the y-coordinates"""
+        xa = self.xa
+        ya = self.ya
+        xa[:] = pos[0]
+        ya[:] = pos[1]
+        self._hline_x[1:-1] = xa
+        self._vline_y[1:-1] = ya
+        for l, y in zip(self.hlines, ya):
+            l.set_data(self._hline_x, np.full(len(self._hline_x), y))
+        for l, x in zip(self.vlines, xa):
+            l.set_data(np.full(len(self._vline_y), x), self._vline_y)
+        for (i, x), (j, y) in product(enumerate(xa), enumerate(ya)):
+            for l in self._all_line_connections[j, i]:
+                l.set_data([x, l.get_xdata()[1]], [y, l.get_ydata()[1]])
+            for l in self._all_other_connections[j, i]:
+                l.set_data([l.get_xdata()[0], x], [l.get_ydata()[0], y])
+
 
 class DraggableHLine(CrossMarks):
     """A draggable horizontal line"""
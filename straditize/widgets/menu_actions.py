@@ -826,6 +826,11 @@ class StraditizerMenuActions(StraditizerControlBase):
             # -- Compression with a level of 4. Requires netcdf4 engine
             comp = dict(zlib=True, complevel=4)
             encoding = {var: comp for var in ds.data_vars}
+            # store the (zero-padded) column name pictures column by column
+            # such that the padding of each column is compressed together
+            if 'colpic' in ds:
+                encoding['colpic'] = dict(
+                    comp, chunksizes=(1, ) + ds['colpic'].shape[1:])
 
             ds.to_netcdf(fname, encoding=encoding, engine='netcdf4')
 
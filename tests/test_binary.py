@@ -235,6 +235,17 @@ class DataReaderTest(unittest.TestCase, AlmostArrayEqualMixin):
         ref_excluded = [[6, 7], [7, 8]]
         self.assertEqual(excluded, ref_excluded)
 
+    def test_obstacle_mask(self):
+        """Test the vectorized identification of obstacles per row"""
+        a = np.array([
+            5, 6, 7, 7, 6, 5, 3, 4, 3, 2, 1, 1, 2, 3, 4, 3, 2, np.nan, 2, 2,
+            3, 4, 4, 5, 4, 3, 3, 1])
+        ref = [False] + [self.reader.is_obstacle([i], a)
+                         for i in range(1, len(a))]
+        mask = self.reader.get_obstacle_mask(a)
+        self.assertEqual(mask.tolist(), ref)
+        self.assertTrue(mask.any())
+
     def test_find_samples(self, fail_fast=False):
         """Test the finding and alignment of samples
 
@@ -284,5 +295,31 @@ class DataReaderTest(unittest.TestCase, AlmostArrayEqualMixin):
             test()
 
 
+class BarDataReaderTest(unittest.TestCase):
+
+    def setUp(self):
+        self.reader = binary.BarDataReader(np.zeros((10, 10), dtype=int),
+                                           plot=False)
+
+    def tearDown(self):
+        import matplotlib.pyplot as plt
+        plt.close('all')
+        del self.reader
+
+    def test_find_potential_samples_inplace_columns(self):
+        """Test the lookup of the bars after shifting the columns in place"""
+        reader = self.reader
+        reader.columns = [0, 1, 2]
+        reader._all_indices = [[[0, 2]], [[3, 5]], [[6, 9]]]
+        self.assertEqual(reader.find_potential_samples(1)[0], [[3, 5]])
+        # shift the columns in place as it is done by the StackedReader
+        for i, col in enumerate(reader.columns):
+            if col >= 1:
+                reader.columns[i] += 1
+        self.assertEqual(reader.columns, [0, 2, 3])
+        self.assertEqual(reader.find_potential_samples(2)[0], [[3, 5]])
+        self.assertEqual(reader.find_potential_samples(3)[0], [[6, 9]])
+
+
 if __name__ == '__main__':
     unittest.main()
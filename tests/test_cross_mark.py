@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+"""
+Test module for the :mod:`straditize.cross_mark` module
+"""
+import unittest
+from types import SimpleNamespace
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.backend_bases import TimerBase
+from straditize.cross_mark import CrossMarks
+
+
+class ManualTimer(TimerBase):
+    """A timer that only fires when :meth:`fire` is called"""
+
+    started = False
+
+    def _timer_start(self):
+        self.started = True
+
+    def _timer_stop(self):
+        self.started = False
+
+    def fire(self):
+        self.started = False
+        self._on_timer()
+
+
+class CrossMarksMotionTest(unittest.TestCase):
+    """Test the dragging of connected marks with and without throttling"""
+
+    def setUp(self):
+        self.fig = Figure()
+        FigureCanvasAgg(self.fig)
+        self.ax = ax = self.fig.add_subplot(111)
+        ax.set_xlim(0, 10)
+        ax.set_ylim(0, 10)
+        self.mark = CrossMarks((2., 3.), ax=ax)
+        self.other = CrossMarks((6., 5.), ax=ax)
+        CrossMarks.maintain_y([self.mark, self.other])
+
+    def tearDown(self):
+        CrossMarks.lock = None
+        del self.fig, self.ax, self.mark, self.other
+
+    def event(self, x, y):
+        return SimpleNamespace(xdata=x, ydata=y, inaxes=self.ax, button=1,
+                               key=None)
+
+    def drag(self, *positions):
+        """Press the mark, move it to `positions` and yield after each move"""
+        self.mark.on_press(self.event(2., 3.), force=True)
+        for x, y in positions:
+            self.mark.on_motion(self.event(x, y))
+            yield x, y
+
+    def assertPositions(self, y):
+        self.assertEqual(self.mark.y, y)
+        self.assertEqual(self.other.y, y + 2)
+        self.assertEqual(self.mark.hline.get_ydata()[0], y)
+        self.assertEqual(self.other.hline.get_ydata()[0], y + 2)
+
+    def test_motion_unthrottled(self):
+        """Test that every motion moves the connected marks immediately"""
+        self.assertEqual(self.mark.motion_interval, 0)
+        for x, y in self.drag((2., 4.), (2., 4.5), (2., 1.)):
+            self.assertPositions(y)
+        self.mark.on_release(self.event(2., 1.), force=True)
+        self.assertPositions(1.)
+        self.assertIsNone(self.mark.press)
+
+    def test_motion_throttled_without_timer(self):
+        """Test that the throttle is ignored if the canvas has no timers"""
+        self.mark.motion_interval = 60.
+        for x, y in self.drag((2., 4.), (2., 4.5), (2., 1.)):
+            self.assertPositions(y)
+        self.assertFalse(self.mark._motion_timer)
+        self.mark.on_release(self.event(2., 1.), force=True)
+        self.assertPositions(1.)
+
+    def test_motion_throttled(self):
+        """Test that throttled motions are processed by the timer"""
+        timer = ManualTimer()
+        self.fig.canvas.new_timer = lambda *args, **kwargs: timer
+        self.mark.motion_interval = 60.
+        moves = self.drag((2., 4.), (2., 4.5), (2., 5.))
+        next(moves)
+        self.assertPositions(4.)
+        next(moves)
+        # the second motion is deferred
+        self.assertPositions(4.)
+        self.assertTrue(timer.started)
+        timer.fire()
+        self.assertPositions(4.5)
+        next(moves)
+        self.assertPositions(4.5)
+        # releasing the mark processes the pending motion
+        self.mark.on_release(self.event(2., 5.), force=True)
+        self.assertPositions(5.)
+        self.assertIsNone(self.mark._pending_motion)
+
+
+if __name__ == '__main__':
+    unittest.main()